@@ -57,9 +57,11 @@ def _(pl):
 
 @app.cell
 def _(mo, n_row):
-    status_widget = mo.ui.switch()
-    status_widgets = mo.ui.array([status_widget] * n_row)
-    return (status_widgets,)
+    status_widgets = mo.ui.array([mo.ui.switch() for _ in range(n_row)])
+
+    # a switch's markup is fixed at construction, so collect it once here
+    status_html = [w.text for w in status_widgets]
+    return status_html, status_widgets
 
 
 @app.function
@@ -80,17 +82,11 @@ def create_bar(
 
 
 @app.cell
-def _(GT, df, html, n_row, pl, status_widgets):
-    done_count = sum(s.value for s in status_widgets)
+def _(GT, df, html, n_row, pl, status_html, status_widgets):
+    done_count = sum(status_widgets.value)
 
     gt = (
-        GT(
-            df.with_columns(
-                pl.Series(
-                    [status._repr_html_() for status in status_widgets]
-                ).alias("Status")
-            )
-        )
+        GT(df.with_columns(pl.Series("Status", status_html, dtype=pl.String)))
         .tab_source_note(f"{done_count} / {n_row}")
         .tab_source_note(
             html(
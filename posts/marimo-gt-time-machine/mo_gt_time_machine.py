@@ -13,103 +13,102 @@ def _():
 
 @app.cell
 def _():
-    import copy
-    import inspect
+    from collections import OrderedDict
     from functools import wraps
     from typing import Callable, Self
 
-    import pandas as pd
     from great_tables import GT, html
     from great_tables.data import airquality
 
-    return Callable, GT, Self, airquality, copy, html, inspect, wraps
+    return Callable, GT, OrderedDict, Self, airquality, html, wraps
 
 
 @app.cell
-def _(Callable, GT, Self, copy, html, inspect, wraps):
-    def get_allowed_member_names() -> list[str]:
-        """
-        Manually constructing the list —
-        it would be great if Great Tables exposed the available method names.
-        """
-        return [
-            "fmt",
-            "fmt_number",
-            "fmt_integer",
-            "fmt_percent",
-            "fmt_scientific",
-            "fmt_currency",
-            "fmt_bytes",
-            "fmt_roman",
-            "fmt_date",
-            "fmt_time",
-            "fmt_datetime",
-            "fmt_markdown",
-            "fmt_image",
-            "fmt_icon",
-            "fmt_flag",
-            "fmt_units",
-            "fmt_nanoplot",
-            "data_color",
-            "sub_missing",
-            "sub_zero",
-            "opt_stylize",
-            "opt_align_table_header",
-            "opt_all_caps",
-            "opt_footnote_marks",
-            "opt_row_striping",
-            "opt_vertical_padding",
-            "opt_horizontal_padding",
-            "opt_table_outline",
-            "opt_table_font",
-            "cols_align",
-            "cols_width",
-            "cols_label",
-            "cols_move",
-            "cols_move_to_start",
-            "cols_move_to_end",
-            "cols_hide",
-            "cols_unhide",
-            "tab_header",
-            "tab_source_note",
-            "tab_spanner",
-            "tab_stubhead",
-            "tab_style",
-            "tab_options",
-            "row_group_order",
-            "tab_stub",
-            "with_id",
-            "with_locale",
-            "save",
-            "show",
-            "as_raw_html",
-            "write_raw_html",
-            "as_latex",
-            "pipe",
-        ]
+def _(Callable, GT, OrderedDict, Self, html, wraps):
+    # Manually constructing the list —
+    # it would be great if Great Tables exposed the available method names.
+    GT_PIPELINE_METHODS: tuple[str, ...] = (
+        "fmt",
+        "fmt_number",
+        "fmt_integer",
+        "fmt_percent",
+        "fmt_scientific",
+        "fmt_currency",
+        "fmt_bytes",
+        "fmt_roman",
+        "fmt_date",
+        "fmt_time",
+        "fmt_datetime",
+        "fmt_markdown",
+        "fmt_image",
+        "fmt_icon",
+        "fmt_flag",
+        "fmt_units",
+        "fmt_nanoplot",
+        "data_color",
+        "sub_missing",
+        "sub_zero",
+        "opt_stylize",
+        "opt_align_table_header",
+        "opt_all_caps",
+        "opt_footnote_marks",
+        "opt_row_striping",
+        "opt_vertical_padding",
+        "opt_horizontal_padding",
+        "opt_table_outline",
+        "opt_table_font",
+        "cols_align",
+        "cols_width",
+        "cols_label",
+        "cols_move",
+        "cols_move_to_start",
+        "cols_move_to_end",
+        "cols_hide",
+        "cols_unhide",
+        "tab_header",
+        "tab_source_note",
+        "tab_spanner",
+        "tab_stubhead",
+        "tab_style",
+        "tab_options",
+        "row_group_order",
+        "tab_stub",
+        "with_id",
+        "with_locale",
+        "save",
+        "show",
+        "as_raw_html",
+        "write_raw_html",
+        "as_latex",
+        "pipe",
+    )
+    GT_PIPELINE_FUNCS = {
+        name: getattr(GT, name) for name in GT_PIPELINE_METHODS
+    }
 
     def lazify(cls: GT) -> GT:
         def add_to_pipeline(func: Callable[..., GT]) -> callable:
             @wraps(func)
             def wrapper(self, *args, **kwargs):
-                def inner(self):
-                    return func(self, *args, **kwargs)
-
-                # container for storing callable objects
-                self._pipeline.append(inner)
+                # container for storing (func, args, kwargs) stages
+                self._pipeline.append((func, args, kwargs))
                 return self
 
-            wrapper.__signature__ = inspect.signature(func)
+            # signature tooling follows __wrapped__, set by wraps
             return wrapper
 
-        for member_name in get_allowed_member_names():
-            setattr(
-                cls, member_name, add_to_pipeline(getattr(GT, member_name))
-            )
+        for member_name, func in GT_PIPELINE_FUNCS.items():
+            setattr(cls, member_name, add_to_pipeline(func))
         return cls
 
     @lazify
     class WigGT:
+        # rendered HTML per (step, widget markup), shared across re-runs of
+        # the cell; each entry is (args, kwargs, stages, html). Entries pin
+        # their input data, so keep roughly one slider's worth of steps.
+        _html_cache: OrderedDict[tuple[int, str], tuple] = OrderedDict()
+        _html_cache_size = 8
+
         def __init__(self, *args, widget, **kwargs):
             self._args = args
             self._widget = widget
@@ -125,20 +124,45 @@ def _(Callable, GT, Self, copy, html, inspect, wraps):
 
         def collect(self) -> Self:
             if not self._is_collect:
-                new_obj = self._tables[0]  # don't use self._wtables[0]
-                for f in self._pipeline:
-                    new_obj = f(self=copy.copy(new_obj))
+                new_obj = self._tables[0]  # don't use a widgetified table
+                for func, args, kwargs in self._pipeline:
+                    # GT methods return a new GT, so no defensive copy needed
+                    new_obj = func(new_obj, *args, **kwargs)
                     self._tables.append(new_obj)
-                    self._wtables.append(self._widgetify(new_obj))
                 self._is_collect = True
             return self
 
+        def _has_same_inputs(self, entry: tuple, step: int) -> bool:
+            args, kwargs, stages, _ = entry
+            # the entry keeps its args alive, so `is` can't match a reused id
+            if len(args) != len(self._args) or any(
+                a is not b for a, b in zip(args, self._args)
+            ):
+                return False
+            try:
+                return (
+                    kwargs == self._kwargs
+                    and stages == self._pipeline[:step]
+                )
+            except (TypeError, ValueError):
+                # e.g. a DataFrame argument, whose == is elementwise
+                return False
+
         def _repr_html_(self) -> str:
+            step = self._widget.value
             try:
-                obj = self._wtables[self._widget.value]
+                obj = self._tables[step]
             except IndexError:
-                obj = self._wtables[-1]
+                step, obj = len(self._tables) - 1, self._tables[-1]
 
+            # the widget is embedded in the table, so its markup is in the key
+            cache_key = (step, self._widget.text)
+            entry = self._html_cache.get(cache_key)
+            if entry is not None and self._has_same_inputs(entry, step):
+                self._html_cache.move_to_end(cache_key)
+                return entry[-1]
+
+            obj = self._widgetify(obj)
             if hasattr(obj, "_display_"):
                 render_method = "_display_"
             elif hasattr(obj, "_repr_html_"):
@@ -149,11 +173,21 @@ def _(Callable, GT, Self, copy, html, inspect, wraps):
                 raise AttributeError(
                     "The object does not have a valid render method."
                 )
-            return getattr(obj, render_method)()  # remember to invoke
+            rendered = getattr(obj, render_method)()  # remember to invoke
+            self._html_cache[cache_key] = (
+                self._args,
+                self._kwargs,
+                self._pipeline[:step],
+                rendered,
+            )
+            self._html_cache.move_to_end(cache_key)
+            while len(self._html_cache) > self._html_cache_size:
+                self._html_cache.popitem(last=False)
+            return rendered
 
         def set_to_init(self) -> None:
             if not getattr(self, "_pipeline", None):
-                self._pipeline: list[callable] = []
+                self._pipeline: list[tuple[callable, tuple, dict]] = []
             else:
                 self._pipeline.clear()
 
@@ -162,14 +196,8 @@ def _(Callable, GT, Self, copy, html, inspect, wraps):
             else:
                 self._tables.clear()
 
-            if not getattr(self, "_wtables", None):
-                self._wtables = []
-            else:
-                self._wtables.clear()
-
             obj = self._make_gt()
             self._tables.append(obj)
-            self._wtables.append(self._widgetify(obj))
             self._is_collect = False
 
         def _make_gt(self) -> GT:
@@ -186,10 +214,18 @@ def _(mo):
 
 
 @app.cell
-def _(WigGT, airquality, html, time_widget):
+def _(airquality):
+    # Built outside the widget's cell so the data (and its cache key) stays
+    # the same while the slider moves.
+    data = airquality.head(10).assign(Year=1973)
+    return (data,)
+
+
+@app.cell
+def _(WigGT, data, html, time_widget):
     # The lazy_wig_gt object is not interactive until collect() is called.
     lazy_wig_gt = (
-        WigGT(airquality.head(10).assign(Year=1973), widget=time_widget)
+        WigGT(data, widget=time_widget)
         .opt_stylize(color="pink", style=2)
         .tab_header(
             title="New York Air Quality Measurements",
@@ -13,18 +13,18 @@ def _():
 
 @app.cell
 def _():
-    import random
-    from collections.abc import Iterable
-
     import pandas as pd
     from great_tables import GT, html
 
-    return GT, Iterable, html, pd, random
+    return GT, html, pd
 
 
 @app.cell
-def _(Iterable):
-    def render_widget(widget):
+def _():
+    # render method name per widget class, resolved on first use
+    render_method_cache: dict[type, str] = {}
+
+    def resolve_render_method(widget) -> str:
         if hasattr(widget, "_display_"):
             render_method = "_display_"
         elif hasattr(widget, "_repr_html_"):
@@ -33,26 +33,31 @@ def _(Iterable):
             render_method = "_mime_"
         else:
             raise ValueError("The object does not have a valid render method.")
+        render_method_cache[type(widget)] = render_method
+        return render_method
+
+    def render_widget(widget):
+        render_method = render_method_cache.get(type(widget))
+        if render_method is None:
+            render_method = resolve_render_method(widget)
         return getattr(widget, render_method)()
 
     def render_widgets(widgets):
-        if not isinstance(widgets, Iterable):
-            widgets = [widgets]
         return [render_widget(widget) for widget in widgets]
 
     def strify_widget_value(widget):
         return str(widget.value)
 
     def strify_widget_values(widgets):
-        if not isinstance(widgets, Iterable):
-            widgets = [widgets]
         return [strify_widget_value(w) for w in widgets]
 
     return render_widgets, strify_widget_values
 
 
 @app.cell
-def _(mo, random):
+def _(mo):
+    import random
+
     switch = mo.ui.switch()
     checkbox = mo.ui.checkbox(label="check me")
     date = mo.ui.date()
@@ -24,6 +24,12 @@ def _(pl):
     return (df,)
 
 
+@app.cell
+def _(GT, df):
+    base_gt = GT(df)
+    return (base_gt,)
+
+
 @app.cell
 def _(mo):
     style_widget = mo.ui.slider(1, 6, label="Select Style Number")
@@ -41,8 +47,8 @@ def _(mo):
 
 
 @app.cell
-def _(GT, color_widget, df, row_striping_widget, style_widget):
-    GT(df).opt_stylize(
+def _(base_gt, color_widget, row_striping_widget, style_widget):
+    base_gt.opt_stylize(
         style=style_widget.value,
         color=color_widget.value,
         add_row_striping=row_striping_widget.value,
@@ -7,20 +7,20 @@ app = marimo.App(width="medium")
 @app.cell
 def _():
     import marimo as mo
-    import os
-    from html import escape
-    import polars as pl
-    import resend
 
-    return escape, mo, resend
+    return (mo,)
 
 
 @app.cell
-def _(escape, resend):
+def _():
     def send_email(d: dict[str, str]) -> None:
         """
         https://resend.com/docs/send-with-python
         """
+        from html import escape
+
+        import resend
+
         resend.api_key = d["RESEND_API_KEY"]
         from_ = d["from_"]
         to = [mail.strip() for mail in d["to"].split(",")]